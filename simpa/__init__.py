@@ -48,10 +48,18 @@ from .core.simulation import simulate
 
 from .io_handling import load_data_field, load_hdf5, save_data_field, save_hdf5
 from .io_handling.zenodo_download import download_from_zenodo
-from .io_handling.ipasc import export_to_ipasc
 
 from .visualisation.matplotlib_data_visualisation import visualise_data
 from .visualisation.matplotlib_device_visualisation import visualise_device
 
 from .utils.quality_assurance.data_sanity_testing import assert_equal_shapes
 from .utils.quality_assurance.data_sanity_testing import assert_array_well_defined
+
+
+def __getattr__(name):
+    # the IPASC export is only imported when it is used, as pacfish also loads matplotlib, which is expensive to
+    # import and not needed for simulations
+    if name == "export_to_ipasc":
+        from .io_handling.ipasc import export_to_ipasc
+        return export_to_ipasc
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,24 +13,19 @@ class PencilBeamIlluminationGeometry(IlluminationGeometryBase):
     """
 
     def get_mcx_illuminator_definition(self, global_settings) -> dict:
-        source_type = Tags.ILLUMINATION_TYPE_PENCILARRAY
-
         spacing = global_settings[Tags.SPACING_MM]
 
-        device_position = list(self.device_position_mm / spacing + 0.5)
-
-        source_direction = list(self.normalized_source_direction_vector)
-
-        source_param1 = [0, 0, 0, 0]
+        # tolist() directly yields the python floats that are written to the MCX json config
+        device_position = (self.device_position_mm / spacing + 0.5).tolist()
 
-        source_param2 = [0, 0, 0, 0]
+        source_direction = self.normalized_source_direction_vector.tolist()
 
         return {
-            "Type": source_type,
-            "Pos": list(device_position),
+            "Type": Tags.ILLUMINATION_TYPE_PENCILARRAY,
+            "Pos": device_position,
             "Dir": source_direction,
-            "Param1": source_param1,
-            "Param2": source_param2
+            "Param1": [0, 0, 0, 0],
+            "Param2": [0, 0, 0, 0]
         }
 
     def serialize(self) -> dict:
@@ -164,7 +164,7 @@ class IterativeqPAI(ProcessingComponent):
         sigma = self.regularization_sigma(target_intial_pressure, stacked_to_volume)
 
         # initialization
-        absorption = 1e-16 * np.ones(np.shape(target_intial_pressure))
+        absorption = np.full(np.shape(target_intial_pressure), 1e-16)
         y_pos = int(np.shape(absorption)[1] / 2)  # to extract middle slice
         list_of_intermediate_absorptions = []  # if intentional all intermediate iteration updates can be returned
         error_list = []
@@ -366,17 +366,17 @@ class IterativeqPAI(ProcessingComponent):
 
         # scattering must be known a priori at the moment.
         if Tags.DATA_FIELD_SCATTERING_PER_CM in self.global_settings:
-            scattering = float(self.global_settings[Tags.DATA_FIELD_SCATTERING_PER_CM]) * np.ones(shape)
+            scattering = np.full(shape, float(self.global_settings[Tags.DATA_FIELD_SCATTERING_PER_CM]))
         else:
             background_dict = TISSUE_LIBRARY.muscle()
             scattering = float(MolecularComposition.get_properties_for_wavelength(background_dict,
                                                                                   wavelength=800)["mus"])
-            scattering = scattering * np.ones(shape)
+            scattering = np.full(shape, scattering)
 
         if Tags.DATA_FIELD_ANISOTROPY in self.global_settings:
-            anisotropy = float(self.global_settings[Tags.DATA_FIELD_ANISOTROPY]) * np.ones(shape)
+            anisotropy = np.full(shape, float(self.global_settings[Tags.DATA_FIELD_ANISOTROPY]))
         else:
-            anisotropy = float(OpticalTissueProperties.STANDARD_ANISOTROPY) * np.ones(shape)
+            anisotropy = np.full(shape, float(OpticalTissueProperties.STANDARD_ANISOTROPY))
 
         optical_properties = {
             "scattering": scattering,
@@ -427,7 +427,7 @@ class IterativeqPAI(ProcessingComponent):
                                                                      illumination_geometry=_device[idx + 1])
                 fluence += results[Tags.DATA_FIELD_FLUENCE]
 
-            fluence = fluence / len(_device)
+            fluence /= len(_device)
 
         else:
             results = forward_model_implementation.forward_model(absorption_cm=absorption,
@@ -452,11 +452,11 @@ class IterativeqPAI(ProcessingComponent):
         """
 
         if Tags.LASER_PULSE_ENERGY_IN_MILLIJOULE in self.optical_settings:
+            # a scalar gruneisen parameter is broadcast in the computation below, so no volume has to be allocated
             if Tags.DATA_FIELD_GRUNEISEN_PARAMETER in self.global_settings:
-                gamma = self.global_settings[Tags.DATA_FIELD_GRUNEISEN_PARAMETER] * np.ones(np.shape(image_data))
+                gamma = self.global_settings[Tags.DATA_FIELD_GRUNEISEN_PARAMETER]
             else:
                 gamma = calculate_gruneisen_parameter_from_temperature(StandardProperties.BODY_TEMPERATURE_CELCIUS)
-                gamma = gamma * np.ones(np.shape(image_data))
             factor = (self.optical_settings[Tags.LASER_PULSE_ENERGY_IN_MILLIJOULE] / 1000) * 1e6
             absorption = np.array(image_data / ((fluence + sigma) * gamma * factor))
         else:
@@ -477,11 +477,11 @@ class IterativeqPAI(ProcessingComponent):
         """
 
         if Tags.LASER_PULSE_ENERGY_IN_MILLIJOULE in self.optical_settings:
+            # a scalar gruneisen parameter is broadcast in the computation below, so no volume has to be allocated
             if Tags.DATA_FIELD_GRUNEISEN_PARAMETER in self.global_settings:
-                gamma = self.global_settings[Tags.DATA_FIELD_GRUNEISEN_PARAMETER] * np.ones(np.shape(image_data))
+                gamma = self.global_settings[Tags.DATA_FIELD_GRUNEISEN_PARAMETER]
             else:
                 gamma = calculate_gruneisen_parameter_from_temperature(StandardProperties.BODY_TEMPERATURE_CELCIUS)
-                gamma = gamma * np.ones(np.shape(image_data))
             factor = (self.optical_settings[Tags.LASER_PULSE_ENERGY_IN_MILLIJOULE] / 1000) * 1e6
             predicted_pressure = absorption * (fluence + sigma) * gamma * factor
         else:
@@ -58,19 +58,24 @@ class GaussianNoise(ProcessingComponent):
         wavelength = self.global_settings[Tags.WAVELENGTH]
         data_array = load_data_field(self.global_settings[Tags.SIMPA_OUTPUT_PATH], data_field, wavelength)
         data_tensor = torch.as_tensor(data_array, dtype=torch.float32, device=self.torch_device)
-        dist = torch.distributions.normal.Normal(torch.tensor(mean, dtype=torch.float32, device=self.torch_device),
-                                                 torch.tensor(std, dtype=torch.float32, device=self.torch_device))
+
+        if std == 0:
+            # without spread the noise is constant, so no random samples have to be drawn
+            noise = mean
+        else:
+            # the noise is drawn directly into a single preallocated tensor and applied in place
+            noise = torch.empty_like(data_tensor).normal_(mean=mean, std=std)
 
         if mode == Tags.NOISE_MODE_ADDITIVE:
-            data_tensor += dist.sample(data_tensor.shape)
+            data_tensor += noise
         elif mode == Tags.NOISE_MODE_MULTIPLICATIVE:
-            data_tensor *= dist.sample(data_tensor.shape)
+            data_tensor *= noise
 
         if not (Tags.IGNORE_QA_ASSERTIONS in self.global_settings and Tags.IGNORE_QA_ASSERTIONS):
             assert_array_well_defined(data_tensor)
 
         if non_negative:
-            data_tensor[data_tensor < EPS] = EPS
+            data_tensor.clamp_(min=EPS)
         save_data_field(data_tensor.cpu().numpy().astype(np.float64, copy=False),
                         self.global_settings[Tags.SIMPA_OUTPUT_PATH], data_field, wavelength)
 
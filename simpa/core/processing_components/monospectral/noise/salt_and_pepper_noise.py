@@ -41,13 +41,16 @@ class SaltAndPepperNoise(ProcessingComponent):
         data_array = load_data_field(self.global_settings[Tags.SIMPA_OUTPUT_PATH], data_field, wavelength)
         data_tensor = torch.as_tensor(data_array, dtype=torch.float32, device=self.torch_device)
 
-        min_noise = torch.min(data_tensor).item()
-        max_noise = torch.max(data_tensor).item()
         noise_frequency = 0.01
 
         if Tags.NOISE_FREQUENCY in self.component_settings.keys():
             noise_frequency = self.component_settings[Tags.NOISE_FREQUENCY]
 
+        if Tags.NOISE_MIN not in self.component_settings.keys() or Tags.NOISE_MAX not in self.component_settings.keys():
+            # the extrema of the data are only needed as defaults for the noise values that were not set
+            min_noise = torch.min(data_tensor).item()
+            max_noise = torch.max(data_tensor).item()
+
         if Tags.NOISE_MIN in self.component_settings.keys():
             min_noise = self.component_settings[Tags.NOISE_MIN]
 
@@ -58,9 +61,7 @@ class SaltAndPepperNoise(ProcessingComponent):
         self.logger.debug(f"Noise model max: {max_noise}")
         self.logger.debug(f"Noise model frequency: {noise_frequency}")
 
-        dist = torch.distributions.uniform.Uniform(torch.tensor(-1.0, dtype=torch.float32, device=self.torch_device),
-                                                   torch.tensor(1.0, dtype=torch.float32, device=self.torch_device))
-        sample = dist.sample(data_tensor.shape)
+        sample = torch.empty_like(data_tensor).uniform_(-1.0, 1.0)
         sample_cutoff = 1.0 - noise_frequency
         data_tensor[sample > sample_cutoff] = min_noise
         data_tensor[-sample > sample_cutoff] = max_noise
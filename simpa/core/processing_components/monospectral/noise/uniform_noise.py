@@ -54,13 +54,12 @@ class UniformNoise(ProcessingComponent):
         wavelength = self.global_settings[Tags.WAVELENGTH]
         data_array = load_data_field(self.global_settings[Tags.SIMPA_OUTPUT_PATH], data_field, wavelength)
         data_tensor = torch.as_tensor(data_array, dtype=torch.float32, device=self.torch_device)
-        dist = torch.distributions.uniform.Uniform(torch.tensor(min_noise, dtype=torch.float32, device=self.torch_device),
-                                                   torch.tensor(max_noise, dtype=torch.float32, device=self.torch_device))
 
+        # the noise is drawn directly into a single preallocated tensor and applied in place
         if mode == Tags.NOISE_MODE_ADDITIVE:
-            data_tensor += dist.sample(data_tensor.shape)
+            data_tensor += torch.empty_like(data_tensor).uniform_(min_noise, max_noise)
         elif mode == Tags.NOISE_MODE_MULTIPLICATIVE:
-            data_tensor *= dist.sample(data_tensor.shape)
+            data_tensor *= torch.empty_like(data_tensor).uniform_(min_noise, max_noise)
 
         if not (Tags.IGNORE_QA_ASSERTIONS in self.global_settings and Tags.IGNORE_QA_ASSERTIONS):
             assert_array_well_defined(data_tensor)
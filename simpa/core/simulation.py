@@ -4,7 +4,6 @@
 
 from simpa.utils import Tags
 from simpa.io_handling.io_hdf5 import save_hdf5, load_hdf5, save_data_field, load_data_field
-from simpa.io_handling.ipasc import export_to_ipasc
 from simpa.utils.settings import Settings
 from simpa.log import Logger
 from .device_digital_twins.digital_device_twin_base import DigitalDeviceTwinBase
@@ -112,6 +111,8 @@ def simulate(simulation_pipeline: list, settings: Settings, digital_device_twin:
     # Export simulation result to the IPASC format.
     if Tags.DO_IPASC_EXPORT in settings and settings[Tags.DO_IPASC_EXPORT]:
         logger.info("Exporting to IPASC....")
+        # the IPASC export is imported here, as pacfish also loads matplotlib, which is not needed for simulations
+        from simpa.io_handling.ipasc import export_to_ipasc
         export_to_ipasc(settings[Tags.SIMPA_OUTPUT_PATH], device=digital_device_twin)
 
     logger.info(f"The entire simulation pipeline required {time.time() - start_time} seconds.")
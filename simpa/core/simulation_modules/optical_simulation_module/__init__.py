@@ -4,6 +4,7 @@
 from abc import abstractmethod
 from typing import Dict, Union
 
+import h5py
 import numpy as np
 
 from simpa.core import SimulationModule
@@ -62,10 +63,15 @@ class OpticalForwardModuleBase(SimulationModule):
         file_path = self.global_settings[Tags.SIMPA_OUTPUT_PATH]
         wl = str(self.global_settings[Tags.WAVELENGTH])
 
-        absorption = load_data_field(file_path, Tags.DATA_FIELD_ABSORPTION_PER_CM, wl)
-        scattering = load_data_field(file_path, Tags.DATA_FIELD_SCATTERING_PER_CM, wl)
-        anisotropy = load_data_field(file_path, Tags.DATA_FIELD_ANISOTROPY, wl)
-        gruneisen_parameter = load_data_field(file_path, Tags.DATA_FIELD_GRUNEISEN_PARAMETER)
+        # read all input volumes through a single file handle instead of reopening the file for every data field
+        with h5py.File(file_path, "r") as h5file:
+            absorption = load_data_field(h5file, Tags.DATA_FIELD_ABSORPTION_PER_CM, wl)
+            scattering = load_data_field(h5file, Tags.DATA_FIELD_SCATTERING_PER_CM, wl)
+            anisotropy = load_data_field(h5file, Tags.DATA_FIELD_ANISOTROPY, wl)
+            # the gruneisen parameter is only needed to compute the initial pressure in Pascal
+            gruneisen_parameter = None
+            if Tags.LASER_PULSE_ENERGY_IN_MILLIJOULE in self.component_settings:
+                gruneisen_parameter = load_data_field(h5file, Tags.DATA_FIELD_GRUNEISEN_PARAMETER)
 
         _device = None
         if isinstance(device, IlluminationGeometryBase):
@@ -84,21 +90,21 @@ class OpticalForwardModuleBase(SimulationModule):
         if not (Tags.IGNORE_QA_ASSERTIONS in self.global_settings and Tags.IGNORE_QA_ASSERTIONS):
             assert_array_well_defined(fluence, assume_non_negativity=True, array_name="fluence")
 
+        initial_pressure = absorption * fluence
         if Tags.LASER_PULSE_ENERGY_IN_MILLIJOULE in self.component_settings:
             units = Tags.UNITS_PRESSURE
             # Initial pressure should be given in units of Pascale
             conversion_factor = 1e6  # 1 J/cm^3 = 10^6 N/m^2 = 10^6 Pa
-            initial_pressure = (absorption * fluence * gruneisen_parameter *
-                                (self.component_settings[Tags.LASER_PULSE_ENERGY_IN_MILLIJOULE] / 1000)
-                                * conversion_factor)
+            # combine the scalar factors first and scale in place, so that only a single volume is allocated
+            scaling_factor = (self.component_settings[Tags.LASER_PULSE_ENERGY_IN_MILLIJOULE] / 1000) * conversion_factor
+            initial_pressure *= gruneisen_parameter
+            initial_pressure *= scaling_factor
         else:
             units = Tags.UNITS_ARBITRARY
-            initial_pressure = absorption * fluence
 
         if not (Tags.IGNORE_QA_ASSERTIONS in self.global_settings and Tags.IGNORE_QA_ASSERTIONS):
             assert_array_well_defined(initial_pressure, assume_non_negativity=True, array_name="initial_pressure")
 
-        results[Tags.DATA_FIELD_FLUENCE] = fluence
         results[Tags.OPTICAL_MODEL_UNITS] = units
         results[Tags.DATA_FIELD_INITIAL_PRESSURE] = initial_pressure
         optical_output = {}
@@ -106,7 +112,13 @@ class OpticalForwardModuleBase(SimulationModule):
             optical_output[k] = {self.global_settings[Tags.WAVELENGTH]: item}
 
         optical_output_path = generate_dict_path(Tags.OPTICAL_MODEL_OUTPUT_NAME)
-        save_hdf5(optical_output, self.global_settings[Tags.SIMPA_OUTPUT_PATH], optical_output_path)
+        # use the fast lzf compression for the large optical output volumes, unless file compression was deactivated
+        compression = None
+        if not (Tags.DO_FILE_COMPRESSION in self.global_settings and
+                not self.global_settings[Tags.DO_FILE_COMPRESSION]):
+            compression = "lzf"
+        save_hdf5(optical_output, self.global_settings[Tags.SIMPA_OUTPUT_PATH], optical_output_path,
+                  file_compression=compression)
         self.logger.info("Simulating the optical forward process...[Done]")
 
     def run_forward_model(self,
@@ -140,7 +152,7 @@ class OpticalForwardModuleBase(SimulationModule):
                                              illumination_geometry=_device[idx])
                 fluence += results[Tags.DATA_FIELD_FLUENCE]
 
-            fluence = fluence / len(_device)
+            fluence /= len(_device)
 
         else:
             results = self.forward_model(absorption_cm=absorption,
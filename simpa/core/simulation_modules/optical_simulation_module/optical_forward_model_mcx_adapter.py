@@ -7,10 +7,12 @@ import subprocess
 from simpa.utils import Tags, Settings
 from simpa.core.simulation_modules.optical_simulation_module import OpticalForwardModuleBase
 from simpa.core.device_digital_twins.illumination_geometries.illumination_geometry_base import IlluminationGeometryBase
+from simpa.core.device_digital_twins import PhotoacousticDevice
 import json
 import jdata
 import os
-from typing import List, Dict, Tuple
+import weakref
+from typing import List, Dict, Tuple, Union
 
 
 class MCXAdapter(OpticalForwardModuleBase):
@@ -37,6 +39,9 @@ class MCXAdapter(OpticalForwardModuleBase):
         self.mcx_volumetric_data_file = None
         self.frames = None
         self.mcx_output_suffixes = {'mcx_volumetric_data_file': '.jnii'}
+        self.mcx_bin_input_buffer = None
+        self.mcx_bin_input_references = None
+        self.reuse_mcx_bin_input = False
 
     def forward_model(self,
                       absorption_cm: np.ndarray,
@@ -82,6 +87,33 @@ class MCXAdapter(OpticalForwardModuleBase):
         self.remove_mcx_output()
         return results
 
+    def run_forward_model(self,
+                          _device,
+                          device: Union[IlluminationGeometryBase, PhotoacousticDevice],
+                          absorption: np.ndarray,
+                          scattering: np.ndarray,
+                          anisotropy: np.ndarray) -> Dict:
+        """
+        runs `self.forward_model` as many times as defined by `device` and aggregates the results. The MCX input
+        volumes are only pre-processed once for all illumination geometries and are released afterwards.
+
+        :param _device: device illumination geometry
+        :param device: class defining illumination
+        :param absorption: Absorption volume
+        :param scattering: Scattering volume
+        :param anisotropy: Dimensionless scattering anisotropy
+        :return:
+        """
+        self.reuse_mcx_bin_input = True
+        try:
+            return super(MCXAdapter, self).run_forward_model(_device=_device,
+                                                            device=device,
+                                                            absorption=absorption,
+                                                            scattering=scattering,
+                                                            anisotropy=anisotropy)
+        finally:
+            self.release_mcx_bin_input()
+
     def generate_mcx_json_input(self, settings_dict: Dict) -> None:
         """
         generates JSON serializable file with settings needed by MCX to run simulations.
@@ -184,6 +216,13 @@ class MCXAdapter(OpticalForwardModuleBase):
         cmd.append("1")
         cmd.append("-F")
         cmd.append("jnii")
+        if Tags.MCX_GPU_IDS in self.component_settings:
+            # distribute the photons over multiple GPUs
+            cmd.append("-G")
+            cmd.append(str(self.component_settings[Tags.MCX_GPU_IDS]))
+            if Tags.MCX_WORKLOAD in self.component_settings:
+                cmd.append("-W")
+                cmd.append(",".join(str(workload) for workload in self.component_settings[Tags.MCX_WORKLOAD]))
         return cmd
 
     @staticmethod
@@ -207,7 +246,10 @@ class MCXAdapter(OpticalForwardModuleBase):
                                anisotropy: np.ndarray,
                                assumed_anisotropy: np.ndarray) -> None:
         """
-        generates binary file containing volume scattering and absorption as input for MCX
+        generates binary file containing volume scattering and absorption as input for MCX. Within a single call of
+        `self.run_forward_model`, the volumes pre-processed for the first illumination geometry are written again for
+        the following ones instead of being recomputed. Outside of it, e.g. when `self.forward_model` is called
+        directly, the volumes are always pre-processed, as the given arrays might have been modified in place.
 
         :param absorption_cm: Absorption in units of per centimeter
         :param scattering_cm: Scattering in units of per centimeter
@@ -215,12 +257,23 @@ class MCXAdapter(OpticalForwardModuleBase):
         :param assumed_anisotropy:
         :return: None
         """
-        absorption_mm, scattering_mm = self.pre_process_volumes(**{'absorption_cm': absorption_cm,
-                                                                   'scattering_cm': scattering_cm,
-                                                                   'anisotropy': anisotropy,
-                                                                   'assumed_anisotropy': assumed_anisotropy})
-        # stack arrays to give array with shape (nx,ny,nz,2)
-        op_array = np.stack([absorption_mm, scattering_mm], axis=-1, dtype=np.float32)
+        mcx_input = (absorption_cm, scattering_cm, anisotropy, assumed_anisotropy)
+        if not (self.reuse_mcx_bin_input and self.is_current_mcx_bin_input(mcx_input)):
+            absorption_mm, scattering_mm = self.pre_process_volumes(**{'absorption_cm': absorption_cm,
+                                                                       'scattering_cm': scattering_cm,
+                                                                       'anisotropy': anisotropy,
+                                                                       'assumed_anisotropy': assumed_anisotropy})
+            # interleave arrays to give array with shape (nx,ny,nz,2). The float32 buffer is allocated once and reused
+            # for all simulations of volumes with the same dimensions
+            volume_shape = np.shape(absorption_mm)
+            if self.mcx_bin_input_buffer is None or self.mcx_bin_input_buffer.shape[:-1] != volume_shape:
+                self.mcx_bin_input_buffer = np.empty(volume_shape + (2,), dtype=np.float32)
+            self.mcx_bin_input_buffer[..., 0] = absorption_mm
+            self.mcx_bin_input_buffer[..., 1] = scattering_mm
+            # only keep weak references to the input arrays, so that they can be freed after the simulation
+            self.mcx_bin_input_references = tuple(weakref.ref(item) if isinstance(item, np.ndarray) else item
+                                                  for item in mcx_input)
+        op_array = self.mcx_bin_input_buffer
         [self.nx, self.ny, self.nz, _] = np.shape(op_array)
         # # create a binary of the volume
         tmp_input_path = self.global_settings[Tags.SIMULATION_PATH] + "/" + \
@@ -229,6 +282,34 @@ class MCXAdapter(OpticalForwardModuleBase):
         # write array in 'C' order to binary file
         op_array.tofile(tmp_input_path)
 
+    def release_mcx_bin_input(self) -> None:
+        """
+        frees the pre-processed volumes kept by `self.generate_mcx_bin_input`, so that they don't stay in memory
+        after all illumination geometries of a simulation were run, and stops reusing them for later calls
+
+        :return: None
+        """
+        self.reuse_mcx_bin_input = False
+        self.mcx_bin_input_buffer = None
+        self.mcx_bin_input_references = None
+
+    def is_current_mcx_bin_input(self, mcx_input: Tuple) -> bool:
+        """
+        checks if the volumes in `self.mcx_bin_input_buffer` were generated from the given input arrays
+
+        :param mcx_input: tuple of the arrays and values given to `self.generate_mcx_bin_input`
+        :return: True if the buffer can be reused, False otherwise
+        """
+        if self.mcx_bin_input_references is None:
+            return False
+        for reference, item in zip(self.mcx_bin_input_references, mcx_input):
+            if isinstance(reference, weakref.ref):
+                if reference() is not item:
+                    return False
+            elif isinstance(item, np.ndarray) or reference != item:
+                return False
+        return True
+
     def read_mcx_output(self, **kwargs) -> Dict:
         """
         reads the temporary output generated with MCX
@@ -237,16 +318,24 @@ class MCXAdapter(OpticalForwardModuleBase):
         :return: `Dict` instance containing the MCX output
         """
         content = jdata.load(self.mcx_volumetric_data_file)
-        fluence = content['NIFTIData']
-        print(f"fluence.shape {fluence.shape}")
-        if fluence.ndim > 3:
-            # remove the 1 or 2 (for mcx >= v2024.1) additional dimensions of size 1 if present to obtain a 3d array
-            fluence = fluence.reshape(fluence.shape[0], fluence.shape[1], -1)
-        print(f"fluence.shape {fluence.shape}")
+        fluence = self.to_3d_volume(content['NIFTIData'])
         results = dict()
         results[Tags.DATA_FIELD_FLUENCE] = fluence
         return results
 
+    @staticmethod
+    def to_3d_volume(fluence: np.ndarray) -> np.ndarray:
+        """
+        removes the 1 or 2 (for mcx >= v2024.1) additional dimensions of size 1 from the MCX output if present to
+        obtain a 3d array
+
+        :param fluence: array containing the fluence as loaded from the MCX output
+        :return: 3d fluence array
+        """
+        if fluence.ndim > 3:
+            fluence = fluence.reshape(fluence.shape[0], fluence.shape[1], -1)
+        return fluence
+
     def remove_mcx_output(self) -> None:
         """
         deletes temporary MCX output files from the file system
@@ -279,20 +368,20 @@ class MCXAdapter(OpticalForwardModuleBase):
         scattering_cm = kwargs.get('scattering_cm')
         absorption_cm = kwargs.get('absorption_cm')
         absorption_mm = absorption_cm / 10
-        scattering_mm = scattering_cm / 10
 
         # FIXME Currently, mcx only accepts a single value for the anisotropy.
         #   In order to use the correct reduced scattering coefficient throughout the simulation,
         #   we adjust the scattering parameter to be more accurate in the diffuse regime.
         #   This will lead to errors, especially in the quasi-ballistic regime.
 
-        given_reduced_scattering = (scattering_mm * (1 - kwargs.get('anisotropy')))
+        # the reduced scattering is computed in one temporary array, the conversion to mm is applied in place below
+        scattering_mm = scattering_cm * (1 - kwargs.get('anisotropy'))
 
         # If the anisotropy is 1, all scattering is forward scattering which is equal to no scattering at all
         if kwargs.get("assumed_anisotropy") == 1:
-            scattering_mm = given_reduced_scattering * 0
+            scattering_mm *= 0
         else:
-            scattering_mm = given_reduced_scattering / (1 - kwargs.get('assumed_anisotropy'))
+            scattering_mm /= 10 * (1 - kwargs.get('assumed_anisotropy'))
         scattering_mm[scattering_mm < 1e-10] = 1e-10
         return absorption_mm, scattering_mm
 
@@ -95,17 +95,7 @@ class MCXAdapterReflectance(MCXAdapter):
 
         :return: list of MCX commands
         """
-        cmd = list()
-        cmd.append(self.component_settings[Tags.OPTICAL_MODEL_BINARY_PATH])
-        cmd.append("-f")
-        cmd.append(self.mcx_json_config_file)
-        cmd.append("-O")
-        cmd.append("F")
-        # use 'C' order array format for binary input file
-        cmd.append("-a")
-        cmd.append("1")
-        cmd.append("-F")
-        cmd.append("jnii")
+        cmd = super(MCXAdapterReflectance, self).get_command()
         if Tags.COMPUTE_PHOTON_DIRECTION_AT_EXIT in self.component_settings and \
                 self.component_settings[Tags.COMPUTE_PHOTON_DIRECTION_AT_EXIT]:
             cmd.append("-H")
@@ -130,10 +120,7 @@ class MCXAdapterReflectance(MCXAdapter):
         if os.path.isfile(self.mcx_volumetric_data_file) and self.mcx_volumetric_data_file.endswith(
                 self.mcx_output_suffixes['mcx_volumetric_data_file']):
             content = jdata.load(self.mcx_volumetric_data_file)
-            fluence = content['NIFTIData']
-            if fluence.ndim > 3:
-                # remove the 1 or 2 (for mcx >= v2024.1) additional dimensions of size 1 if present to obtain a 3d array
-                fluence = fluence.reshape(fluence.shape[0], fluence.shape[1], -1)
+            fluence = self.to_3d_volume(content['NIFTIData'])
             ref, ref_pos, fluence = self.extract_reflectance_from_fluence(fluence=fluence)
             fluence = self.post_process_volumes(**{'arrays': (fluence,)})[0]
             fluence *= 100  # Convert from J/mm^2 to J/cm^2
@@ -227,7 +214,8 @@ class MCXAdapterReflectance(MCXAdapter):
                           anisotropy: np.ndarray
                           ) -> Dict:
         """
-        runs `self.forward_model` as many times as defined by `device` and aggregates the results.
+        runs `self.forward_model` as many times as defined by `device` and aggregates the results. The MCX input
+        volumes are only pre-processed once for all illumination geometries and are released afterwards.
 
         :param _device: device illumination geometry
         :param device: class defining illumination
@@ -240,44 +228,48 @@ class MCXAdapterReflectance(MCXAdapter):
         reflectance_position = []
         photon_position = []
         photon_direction = []
-        if isinstance(_device, list):
-            # per convention this list has at least two elements
-            results = self.forward_model(absorption_cm=absorption,
-                                         scattering_cm=scattering,
-                                         anisotropy=anisotropy,
-                                         illumination_geometry=_device[0])
-            self._append_results(results=results,
-                                 reflectance=reflectance,
-                                 reflectance_position=reflectance_position,
-                                 photon_position=photon_position,
-                                 photon_direction=photon_direction)
-            fluence = results[Tags.DATA_FIELD_FLUENCE]
-            for idx in range(1, len(_device)):
-                # we already looked at the 0th element, so go from 1 to n-1
+        self.reuse_mcx_bin_input = True
+        try:
+            if isinstance(_device, list):
+                # per convention this list has at least two elements
                 results = self.forward_model(absorption_cm=absorption,
                                              scattering_cm=scattering,
                                              anisotropy=anisotropy,
-                                             illumination_geometry=_device[idx])
+                                             illumination_geometry=_device[0])
                 self._append_results(results=results,
                                      reflectance=reflectance,
                                      reflectance_position=reflectance_position,
                                      photon_position=photon_position,
                                      photon_direction=photon_direction)
-                fluence += results[Tags.DATA_FIELD_FLUENCE]
+                fluence = results[Tags.DATA_FIELD_FLUENCE]
+                for idx in range(1, len(_device)):
+                    # we already looked at the 0th element, so go from 1 to n-1
+                    results = self.forward_model(absorption_cm=absorption,
+                                                 scattering_cm=scattering,
+                                                 anisotropy=anisotropy,
+                                                 illumination_geometry=_device[idx])
+                    self._append_results(results=results,
+                                         reflectance=reflectance,
+                                         reflectance_position=reflectance_position,
+                                         photon_position=photon_position,
+                                         photon_direction=photon_direction)
+                    fluence += results[Tags.DATA_FIELD_FLUENCE]
 
-            fluence = fluence / len(_device)
+                fluence /= len(_device)
 
-        else:
-            results = self.forward_model(absorption_cm=absorption,
-                                         scattering_cm=scattering,
-                                         anisotropy=anisotropy,
-                                         illumination_geometry=_device)
-            self._append_results(results=results,
-                                 reflectance=reflectance,
-                                 reflectance_position=reflectance_position,
-                                 photon_position=photon_position,
-                                 photon_direction=photon_direction)
-            fluence = results[Tags.DATA_FIELD_FLUENCE]
+            else:
+                results = self.forward_model(absorption_cm=absorption,
+                                             scattering_cm=scattering,
+                                             anisotropy=anisotropy,
+                                             illumination_geometry=_device)
+                self._append_results(results=results,
+                                     reflectance=reflectance,
+                                     reflectance_position=reflectance_position,
+                                     photon_position=photon_position,
+                                     photon_direction=photon_direction)
+                fluence = results[Tags.DATA_FIELD_FLUENCE]
+        finally:
+            self.release_mcx_bin_input()
         aggregated_results = dict()
         aggregated_results[Tags.DATA_FIELD_FLUENCE] = fluence
         if reflectance:
@@ -543,9 +543,13 @@ def compute_delay_and_sum_values(time_series_sensor_data: Tensor, sensor_positio
     xx, yy, zz, jj = torch.meshgrid(x, y, z, j)
     jj = jj.long()
 
-    delays = torch.sqrt((yy * spacing_in_mm - sensor_positions[:, 2][jj]) ** 2 +
-                        (xx * spacing_in_mm - sensor_positions[:, 0][jj]) ** 2 +
-                        (zz * spacing_in_mm - sensor_positions[:, 1][jj]) ** 2) \
+    # pack the sensor coordinates into one contiguous row per axis, these broadcast along the last (sensor) dimension
+    # of the grid and don't need to be gathered into full volume sized tensors
+    sensor_x, sensor_z, sensor_y = sensor_positions[:n_sensor_elements].T.contiguous()
+
+    delays = torch.sqrt((yy * spacing_in_mm - sensor_y) ** 2 +
+                        (xx * spacing_in_mm - sensor_x) ** 2 +
+                        (zz * spacing_in_mm - sensor_z) ** 2) \
         / (speed_of_sound_in_m_per_s * time_spacing_in_ms)
 
     # perform index validation
@@ -558,7 +562,11 @@ def compute_delay_and_sum_values(time_series_sensor_data: Tensor, sensor_positio
     torch.clip_(upper_delays, min=0, max=time_series_sensor_data.shape[1] - 1)
     lower_values = time_series_sensor_data[jj, lower_delays]
     upper_values = time_series_sensor_data[jj, upper_delays]
-    values = lower_values * (upper_delays - delays) + upper_values * (delays - lower_delays)
+    # fused linear interpolation, the weight of the upper sample is the fractional part of the delay
+    delays -= lower_delays
+    # torch.lerp needs a single dtype, so promote time series and delays (from the sensor positions) to a common one
+    dtype = torch.promote_types(lower_values.dtype, delays.dtype)
+    values = torch.lerp(lower_values.to(dtype), upper_values.to(dtype), delays.to(dtype))
 
     # perform apodization if specified
     if Tags.RECONSTRUCTION_APODIZATION_METHOD in component_settings:
@@ -11,6 +11,10 @@ from simpa.utils.serializer import SerializableSIMPAClass
 
 logger = Logger()
 
+# Edge length of the cubic chunks used for compressed volumes. Reading a full volume then touches few, large chunks
+# instead of the many small row-shaped chunks that the h5py auto-chunking results in for 3D data.
+VOLUME_CHUNK_EDGE_LENGTH = 32
+
 
 def save_hdf5(save_item, file_path: str, file_dictionary_path: str = "/", file_compression: str = None):
     """
@@ -49,15 +53,17 @@ def save_hdf5(save_item, file_path: str, file_dictionary_path: str = "/", file_c
                         h5file[path + key] = item
                 else:
                     c = None
+                    chunks = None
                     if isinstance(item, np.ndarray):
                         c = compression
+                        chunks = get_chunk_shape(item, compression)
 
                     try:
-                        h5file.create_dataset(path + key, data=item, compression=c)
+                        h5file.create_dataset(path + key, data=item, compression=c, chunks=chunks)
                     except (OSError, RuntimeError, ValueError):
                         del h5file[path + key]
                         try:
-                            h5file.create_dataset(path + key, data=item, compression=c)
+                            h5file.create_dataset(path + key, data=item, compression=c, chunks=chunks)
                         except RuntimeError as e:
                             logger.critical("item " + str(item) + " of type " + str(type(item)) +
                                             " was not serializable! Full exception: " + str(e))
@@ -103,11 +109,27 @@ def save_hdf5(save_item, file_path: str, file_dictionary_path: str = "/", file_c
             data_grabber(h5file, file_dictionary_path, dictionary, file_compression)
 
 
+def get_chunk_shape(array: np.ndarray, compression: str = None):
+    """
+    Determines the chunk shape that is used to store the given array in an hdf5 file.
+    Compressed volumes (3 or more dimensions) are stored in cubic chunks with an edge length of
+    ``VOLUME_CHUNK_EDGE_LENGTH`` voxels, all other arrays use the chunking defined by h5py.
+
+    :param array: the array to be stored.
+    :param compression: the compression that is used for the corresponding dataset.
+    :returns: the chunk shape as a tuple or None if the h5py default should be used.
+    """
+    if compression is None or array.ndim < 3 or array.size == 0:
+        return None
+    return tuple(min(dim, VOLUME_CHUNK_EDGE_LENGTH) for dim in array.shape)
+
+
 def load_hdf5(file_path, file_dictionary_path="/"):
     """
     Loads a dictionary from an hdf5 file.
 
-    :param file_path: Path of the file to load the dictionary from.
+    :param file_path: Path of the file to load the dictionary from. An already opened h5py.File can be passed
+        instead, so that several loads from the same file only have to open it once.
     :param file_dictionary_path: Path in dictionary structure of hdf5 file to lo the dictionary in.
     :returns: Dictionary
     :rtype: dict
@@ -164,6 +186,10 @@ def load_hdf5(file_path, file_dictionary_path="/"):
                     dictionary[key] = data_grabber(file, path + key + "/")
         return dictionary
 
+    if isinstance(file_path, h5py.File):
+        h5file = file_path
+        return data_grabber(h5file, file_dictionary_path)
+
     with h5py.File(file_path, "r") as h5file:
         return data_grabber(h5file, file_dictionary_path)
 
@@ -4,29 +4,19 @@
 
 
 import numpy as np
-from scipy.interpolate import interp1d
+from scipy.interpolate import make_interp_spline
+
+# Number of candidate samples that positive_gauss draws at once before rejecting the non-positive ones
+POSITIVE_GAUSS_BATCH_SIZE = 16
 
 
 def calculate_oxygenation(molecule_list):
     """
     :return: an oxygenation value between 0 and 1 if possible, or None, if not computable.
     """
-    hb = None
-    hbO2 = None
-
-    for molecule in molecule_list:
-        if molecule.spectrum.spectrum_name == "Deoxyhemoglobin":
-            hb = molecule.volume_fraction
-        if molecule.spectrum.spectrum_name == "Oxyhemoglobin":
-            hbO2 = molecule.volume_fraction
-
-    if hb is None and hbO2 is None:
-        return None
-
-    if hb is None:
-        hb = 0
-    elif hbO2 is None:
-        hbO2 = 0
+    volume_fractions = {molecule.spectrum.spectrum_name: molecule.volume_fraction for molecule in molecule_list}
+    hb = volume_fractions.get("Deoxyhemoglobin", 0)
+    hbO2 = volume_fractions.get("Oxyhemoglobin", 0)
 
     if hb + hbO2 < 1e-10:  # negative values are not allowed and division by (approx) zero
         return None        # will lead to negative side effects.
@@ -36,14 +26,15 @@ def calculate_oxygenation(molecule_list):
 
 def create_spline_for_range(xmin_mm=0, xmax_mm=10, maximum_y_elevation_mm=1, spacing=0.1):
     """
-    Creates a functional that simulates distortion along the y position
+    Creates a spline that simulates distortion along the y position
     between the minimum and maximum x positions. The elevation can never be
     smaller than 0 or bigger than maximum_y_elevation_mm.
 
-    :param xmin_mm: the minimum x axis value the return functional is defined in
-    :param xmax_mm: the maximum x axis value the return functional is defined in
-    :param maximum_y_elevation_mm: the maximum y axis value the return functional will yield
-    :return: a functional that describes a distortion field along the y axis
+    :param xmin_mm: the minimum x axis value the spline is defined in
+    :param xmax_mm: the maximum x axis value the spline is defined in
+    :param maximum_y_elevation_mm: the maximum y axis value the spline will yield
+    :return: the spline sampled at every voxel along the x axis, describing a distortion field along the y axis,
+        and its minimum
 
     """
     # Convert units from mm spacing to voxel spacing.
@@ -65,22 +56,20 @@ def create_spline_for_range(xmin_mm=0, xmax_mm=10, maximum_y_elevation_mm=1, spa
     constraints = np.linspace(left_boundary, right_boundary, divisions + 1)
 
     # Add random permutations to the y-axis of the division knots
-    for i in range(0, divisions + 1):
-        scaling_value = np.sqrt(2 - ((i - (divisions / 2)) / (divisions / 2)) ** 2)
+    knots = np.arange(0, divisions + 1)
+    scaling_values = np.sqrt(2 - ((knots - (divisions / 2)) / (divisions / 2)) ** 2)
+    constraints *= np.random.normal(scaling_values, 0.2)
+    np.clip(constraints, maximum_y_elevation_mm, 0, out=constraints)
 
-        constraints[i] = np.random.normal(scaling_value, 0.2) * constraints[i]
-        if constraints[i] < maximum_y_elevation_mm:
-            constraints[i] = maximum_y_elevation_mm
-        if constraints[i] > 0:
-            constraints[i] = 0
+    constraints -= np.max(constraints)
 
-    constraints = constraints - np.max(constraints)
+    spline = make_interp_spline(locations, constraints, k=order)
 
-    spline = interp1d(locations, constraints, order)
+    # sample the spline once for all voxels, so that it can be looked up instead of evaluated per voxel
+    spline_values = spline(np.arange(0, int(round(xmax_voxels)), 1) * spacing)
+    max_el = np.min(spline_values)
 
-    max_el = np.min(spline(np.arange(0, int(round(xmax_voxels)), 1) * spacing))
-
-    return spline, max_el
+    return spline_values, max_el
 
 
 def spline_evaluator2d_voxel(x, y, spline, offset_voxel, thickness_voxel):
@@ -121,7 +110,7 @@ def randomize_uniform(min_value: float, max_value: float):
     :return: random number in [min_value, max_value[
 
     """
-    return (np.random.random() * (max_value-min_value)) + min_value
+    return np.random.uniform(min_value, max_value)
 
 
 def rotation_x(theta):
@@ -131,9 +120,10 @@ def rotation_x(theta):
     :param theta: Angle through which the matrix is supposed to rotate.
     :return: rotation matrix
     """
+    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
     return np.array([[1, 0, 0],
-                    [0, np.cos(theta), -np.sin(theta)],
-                    [0, np.sin(theta), np.cos(theta)]])
+                    [0, cos_theta, -sin_theta],
+                    [0, sin_theta, cos_theta]])
 
 
 def rotation_y(theta):
@@ -143,9 +133,10 @@ def rotation_y(theta):
     :param theta: Angle through which the matrix is supposed to rotate.
     :return: rotation matrix
     """
-    return np.array([[np.cos(theta), 0, np.sin(theta)],
+    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
+    return np.array([[cos_theta, 0, sin_theta],
                     [0, 1, 0],
-                    [-np.sin(theta), 0, np.cos(theta)]])
+                    [-sin_theta, 0, cos_theta]])
 
 
 def rotation_z(theta):
@@ -155,8 +146,9 @@ def rotation_z(theta):
     :param theta: Angle through which the matrix is supposed to rotate.
     :return: rotation matrix
     """
-    return np.array([[np.cos(theta), -np.sin(theta), 0],
-                    [np.sin(theta), np.cos(theta), 0],
+    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
+    return np.array([[cos_theta, -sin_theta, 0],
+                    [sin_theta, cos_theta, 0],
                     [0, 0, 1]])
 
 
@@ -167,7 +159,7 @@ def rotation(angles):
     :param angles: Angles through which the matrix is supposed to rotate in the form of [theta_x, theta_y, theta_z].
     :return: rotation matrix
     """
-    return rotation_x(angles[0]) * rotation_y(angles[1]) * rotation_z(angles[2])
+    return rotation_x(angles[0]) @ rotation_y(angles[1]) @ rotation_z(angles[2])
 
 
 def rotation_matrix_between_vectors(a, b):
@@ -180,14 +172,21 @@ def rotation_matrix_between_vectors(a, b):
     """
     a_norm, b_norm = (a / np.linalg.norm(a)).reshape(3), (b / np.linalg.norm(b)).reshape(3)
     cross_product = np.cross(a_norm, b_norm)
-    if np.abs(cross_product.all()) < 1e-10:
-        return np.zeros([3, 3])
     dot_product = np.dot(a_norm, b_norm)
     s = np.linalg.norm(cross_product)
-    mat = np.array([[0, -cross_product[2], cross_product[1]],
-                    [cross_product[2], 0, -cross_product[0]],
-                    [-cross_product[1], cross_product[0], 0]])
-    rotation_matrix = np.eye(3) + mat + mat.dot(mat) * ((1 - dot_product) / (s ** 2))
+    if s < 1e-10:
+        if dot_product > 0:
+            # the vectors are parallel
+            return np.eye(3)
+        # the vectors are antiparallel, so rotate by 180 degrees around an axis perpendicular to a
+        perpendicular = np.cross(a_norm, np.eye(3)[np.argmin(np.abs(a_norm))])
+        perpendicular /= np.linalg.norm(perpendicular)
+        return 2 * np.outer(perpendicular, perpendicular) - np.eye(3)
+    mat = np.zeros((3, 3))
+    mat[0, 1], mat[0, 2] = -cross_product[2], cross_product[1]
+    mat[1, 0], mat[1, 2] = cross_product[2], -cross_product[0]
+    mat[2, 0], mat[2, 1] = -cross_product[1], cross_product[0]
+    rotation_matrix = np.eye(3) + mat + (mat @ mat) * ((1 - dot_product) / (s ** 2))
     return rotation_matrix
 
 
@@ -205,7 +204,9 @@ def min_max_normalization(data: np.ndarray = None) -> np.ndarray:
 
     _min = np.min(data)
     _max = np.max(data)
-    output = (data - _min) / (_max - _min)
+    # subtract into a single floating point output array and divide it in place instead of allocating two temporaries
+    output = np.subtract(data, _min, dtype=np.result_type(data, 1.0))
+    output /= (_max - _min)
 
     return output
 
@@ -217,9 +218,14 @@ def positive_gauss(mean, std) -> float:
     :param mean : float defining the mean ("centre") of the distribution. 
     :param std: float defining the standard deviation (spread or "width") of the distribution. Must be non-negative.
     :return: non-negative random sample from a normal (Gaussian) distribution.
-    """
-    random_value = np.random.normal(mean, std)
-    if random_value <= 0:
-        return positive_gauss(mean, std)
-    else:
-        return random_value
+    :raises ValueError: if std is 0 and mean is not positive, as no positive sample could ever be drawn.
+    """
+    if std == 0 and mean <= 0:
+        raise ValueError(f"A positive sample can not be drawn from a normal distribution with mean {mean} and "
+                         f"standard deviation 0.")
+    # draw candidates in batches, so that frequent rejections don't pay the sampling overhead for every single draw
+    while True:
+        random_values = np.random.normal(mean, std, size=POSITIVE_GAUSS_BATCH_SIZE)
+        positive_values = random_values[random_values > 0]
+        if positive_values.size > 0:
+            return float(positive_values[0])
@@ -2,7 +2,6 @@
 # SPDX-FileCopyrightText: 2021 Janek Groehl
 # SPDX-License-Identifier: MIT
 
-import matplotlib.pyplot as plt
 from simpa.utils import Tags
 from scipy.interpolate import interp2d
 from scipy.ndimage import gaussian_filter
@@ -71,6 +70,8 @@ def get_functional_from_deformation_settings(deformation_settings: dict):
 
 
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
     x_bounds = [0, 9]
     y_bounds = [0, 9]
     max_elevation = 3
@@ -6,7 +6,6 @@ import os
 import inspect
 import glob
 import numpy as np
-import matplotlib.pylab as plt
 from simpa.utils.libraries.literature_values import OpticalTissueProperties
 from simpa.utils.serializer import SerializableSIMPAClass
 
@@ -164,6 +163,8 @@ def view_saved_spectra(save_path=None, mode="absorption"):
     :param save_path: If not None, then the figure will be saved as a png file to the destination.
     :param mode: string that is "absorption", "scattering", or "anisotropy"
     """
+    # matplotlib is only imported when needed, as it is expensive to import and not required for simulations
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(11, 8))
     if mode == "absorption":
         for spectrum in AbsorptionSpectrumLibrary():
@@ -4,7 +4,8 @@
 
 import numpy as np
 import torch
-import inspect
+import sys
+import linecache
 from typing import Union
 
 
@@ -20,15 +21,12 @@ def assert_equal_shapes(numpy_arrays: list):
     if len(numpy_arrays) < 2:
         return
 
-    shapes = np.asarray([np.shape(_arr) for _arr in numpy_arrays]).astype(float)
-    mean = np.mean(shapes, axis=0)
-    for i in range(len(shapes)):
-        shapes[i, :] = shapes[i, :] - mean
+    shapes = {np.shape(_arr) for _arr in numpy_arrays}
 
-    if not np.sum(np.abs(shapes)) <= 1e-5:
+    if len(shapes) != 1:
         raise AssertionError("The given volumes did not all have the same"
                              " dimensions. Please double check the simulation"
-                             f" parameters. Called from {inspect.stack()[1].function}")
+                             f" parameters. Called from {sys._getframe(1).f_code.co_name}")
 
 
 def assert_array_well_defined(array: Union[np.ndarray, torch.Tensor], assume_non_negativity: bool = False,
@@ -46,21 +44,37 @@ def assert_array_well_defined(array: Union[np.ndarray, torch.Tensor], assume_non
 
     error_message = None
     if isinstance(array, np.ndarray) and any(stride < 0 for stride in array.strides):
-        # torch does not support tensors with negative strides so we need to make a copy of the array
-        array_as_tensor = torch.as_tensor(array.copy())
+        # torch does not support tensors with negative strides so we need a contiguous copy of the array
+        array_as_tensor = torch.as_tensor(np.ascontiguousarray(array))
     else:
         array_as_tensor = torch.as_tensor(array)
-    if not torch.all(torch.isfinite(array_as_tensor)):
-        error_message = "nan, inf or -inf"
-    if assume_positivity and torch.any(array_as_tensor <= 0):
-        error_message = "not positive"
-    if assume_non_negativity and torch.any(array_as_tensor < 0):
-        error_message = "negative"
+    if (array_as_tensor.numel() > 0 and not array_as_tensor.is_complex()
+            and array_as_tensor.dtype != torch.bool):
+        # nan values propagate to the extrema and inf values are extrema themselves, so the minimum and maximum
+        # of the array are sufficient to check all assumptions. Integer extrema are always finite.
+        minimum, maximum = torch.min(array_as_tensor), torch.max(array_as_tensor)
+        if not (torch.isfinite(minimum) and torch.isfinite(maximum)):
+            error_message = "nan, inf or -inf"
+        if assume_positivity and minimum <= 0:
+            error_message = "not positive"
+        if assume_non_negativity and minimum < 0:
+            error_message = "negative"
+    else:
+        if not torch.all(torch.isfinite(array_as_tensor)):
+            error_message = "nan, inf or -inf"
+        if assume_positivity and torch.any(array_as_tensor <= 0):
+            error_message = "not positive"
+        if assume_non_negativity and torch.any(array_as_tensor < 0):
+            error_message = "negative"
     if error_message:
         if array_name is None:
             array_name = "'Not specified'"
-        caller = inspect.stack()[1]
-        stack_string = f" \n\tArray Name: {array_name} \n\tCaller: {caller.filename}" \
-                       f" \n\tline: {caller.lineno} \n\tcode: {caller.code_context}"
+        # only look up the calling frame instead of inspecting the whole stack with its source context
+        caller = sys._getframe(1)
+        caller_filename = caller.f_code.co_filename
+        caller_lineno = caller.f_lineno
+        caller_code = linecache.getline(caller_filename, caller_lineno).strip()
+        stack_string = f" \n\tArray Name: {array_name} \n\tCaller: {caller_filename}" \
+                       f" \n\tline: {caller_lineno} \n\tcode: {caller_code}"
         raise AssertionError(f"The given array contained values that were {error_message}."
                              f" Info: {stack_string}.")
@@ -408,6 +408,20 @@ class Tags:
     Usage: module optical_modelling, adapter mcx_adapter
     """
 
+    MCX_GPU_IDS = ("mcx_gpu_ids", str)
+    """
+    String of 0s and 1s defining the GPUs that are used by mcx, e.g. "11" to use the first two GPUs together.
+    If not set, mcx runs on its default GPU.
+    Usage: module optical_modelling, adapter mcx_adapter
+    """
+
+    MCX_WORKLOAD = ("mcx_workload", (list, tuple, np.ndarray))
+    """
+    Relative workload of each GPU selected with Tags.MCX_GPU_IDS, e.g. [50, 50] to distribute the photons equally.
+    If not set, mcx distributes the photons equally between the selected GPUs.
+    Usage: module optical_modelling, adapter mcx_adapter
+    """
+
     ILLUMINATION_TYPE = ("optical_model_illumination_type", str)
     """
     Type of the illumination geometry used in mcx.\n
@@ -3,8 +3,6 @@
 # SPDX-License-Identifier: MIT
 
 from simpa.io_handling import load_hdf5
-import matplotlib.pyplot as plt
-import matplotlib as mpl
 import numpy as np
 from simpa.utils import SegmentationClasses, Tags
 from simpa.utils.path_manager import PathManager
@@ -33,6 +31,8 @@ def visualise_data(wavelength: int = None,
                    log_scale=False,
                    show_xz_only=False,
                    save_path=None):
+    # matplotlib is only imported when needed, as it is expensive to import and not required for simulations
+    import matplotlib.pyplot as plt
 
     if settings is not None and Tags.WAVELENGTHS in settings:
         if wavelength is None or wavelength not in settings[Tags.WAVELENGTHS]:
@@ -249,6 +249,8 @@ def visualise_data(wavelength: int = None,
 
 
 def get_segmentation_colormap():
+    import matplotlib as mpl
+
     values = []
     names = []
 
@@ -4,13 +4,15 @@
 
 from simpa.core.device_digital_twins import PhotoacousticDevice
 from simpa.utils import Tags, Settings
-import matplotlib.pyplot as plt
 
 import os
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 
 
 def visualise_device(device: PhotoacousticDevice, save_path=None):
+    # matplotlib is only imported when needed, as it is expensive to import and not required for simulations
+    import matplotlib.pyplot as plt
+
     settings = Settings()
     settings[Tags.DIM_VOLUME_X_MM] = 100
     settings[Tags.DIM_VOLUME_Y_MM] = 20
@@ -5,13 +5,16 @@
 import simpa as sp
 import numpy as np
 
+# The wavelengths of the custom absorber are the same for every absorber, so they are only created once.
+# The array is read-only, as it is shared between all absorbers.
+CUSTOM_ABSORBER_WAVELENGTHS = np.linspace(200, 1500, 100)
+CUSTOM_ABSORBER_WAVELENGTHS.flags.writeable = False
+
 
 def create_custom_absorber():
-    wavelengths = np.linspace(200, 1500, 100)
     absorber = sp.Spectrum(spectrum_name="random absorber",
-                           wavelengths=wavelengths,
-                           values=np.random.random(
-                               np.shape(wavelengths)))
+                           wavelengths=CUSTOM_ABSORBER_WAVELENGTHS,
+                           values=np.random.random(len(CUSTOM_ABSORBER_WAVELENGTHS)))
     return absorber
 
 
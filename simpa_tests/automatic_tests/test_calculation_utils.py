@@ -9,6 +9,7 @@ from simpa.utils.calculate import calculate_oxygenation
 from simpa.utils.calculate import randomize_uniform
 from simpa.utils.calculate import calculate_gruneisen_parameter_from_temperature
 from simpa.utils.calculate import positive_gauss
+from simpa.utils.calculate import rotation, rotation_x, rotation_y, rotation_z, rotation_matrix_between_vectors
 import numpy as np
 
 
@@ -86,3 +87,30 @@ class TestCalculationUtils(unittest.TestCase):
             std = np.random.rand(1)[0]
             random_value = positive_gauss(mean, std)
             assert random_value > float(0), "positive Gauss value outside the desired range and negative"
+
+        assert positive_gauss(0.5, 0) == 0.5
+        for mean in [0, -1]:
+            with self.assertRaises(ValueError):
+                positive_gauss(mean, 0)
+
+    def test_rotation(self):
+        for _ in range(100):
+            angles = np.random.uniform(-np.pi, np.pi, 3)
+            rotation_matrix = rotation(angles)
+            assert np.allclose(rotation_matrix @ rotation_matrix.T, np.eye(3)), "rotation matrix was not orthogonal"
+            assert np.isclose(np.linalg.det(rotation_matrix), 1), "rotation matrix was not a proper rotation"
+            assert np.allclose(rotation_matrix,
+                               rotation_x(angles[0]) @ rotation_y(angles[1]) @ rotation_z(angles[2]))
+        assert np.allclose(rotation_z(np.pi / 2) @ np.array([1, 0, 0]), np.array([0, 1, 0]))
+
+    def test_rotation_matrix_between_vectors(self):
+        vectors = [np.random.uniform(-1, 1, 3) for _ in range(100)]
+        vectors += [np.array([0, 0, 1]), np.array([0, 1, 1]), np.array([1, 0, 0]), np.array([0, 0, -1]),
+                    np.array([1, 2, -3])]
+        for a in vectors:
+            for b in [np.array([0, 0, 1]), np.random.uniform(-1, 1, 3), -a, 2 * a]:
+                rotation_matrix = rotation_matrix_between_vectors(a, b)
+                assert np.allclose(rotation_matrix @ rotation_matrix.T, np.eye(3)), \
+                    "rotation matrix was not orthogonal"
+                assert np.allclose(rotation_matrix @ (a / np.linalg.norm(a)), b / np.linalg.norm(b)), \
+                    "rotation matrix did not rotate a onto b"
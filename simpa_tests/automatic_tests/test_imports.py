@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2021 Division of Intelligent Medical Systems, DKFZ
+# SPDX-FileCopyrightText: 2021 Janek Groehl
+# SPDX-License-Identifier: MIT
+
+import unittest
+import subprocess
+import sys
+
+
+class TestImports(unittest.TestCase):
+
+    @staticmethod
+    def get_imported_modules(statement):
+        # a fresh interpreter is needed, as matplotlib might have already been imported by other tests
+        result = subprocess.run([sys.executable, "-c", f"{statement}; import sys; print(' '.join(sys.modules))"],
+                                capture_output=True, text=True, check=True)
+        return result.stdout.split()
+
+    def test_importing_simpa_does_not_load_matplotlib(self):
+        for statement in ["import simpa", "import simpa.utils"]:
+            modules = self.get_imported_modules(statement)
+            assert "matplotlib" not in modules, f"'{statement}' imported matplotlib"
+            assert "pacfish" not in modules, f"'{statement}' imported pacfish"
+
+    def test_ipasc_export_is_available(self):
+        modules = self.get_imported_modules("from simpa import export_to_ipasc")
+        assert "simpa.io_handling.ipasc" in modules
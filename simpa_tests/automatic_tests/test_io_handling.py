@@ -11,6 +11,7 @@ from simpa.utils.libraries.tissue_library import TISSUE_LIBRARY, AbsorptionSpect
 from simpa_tests.test_utils import assert_equals_recursive
 from simpa.core.device_digital_twins import *
 import os
+import h5py
 import numpy as np
 
 
@@ -109,3 +110,34 @@ class TestIOHandling(unittest.TestCase):
         save_dictionary = Settings()
         save_dictionary[Tags.DIGITAL_DEVICE] = device
         self.assert_save_and_read_dictionaries_equal(save_dictionary)
+
+    def test_write_and_read_compressed_volumes(self):
+        save_string = "test_compressed.hdf5"
+        save_dictionary = {"volume": np.random.random((70, 20, 40)),
+                           "image": np.random.random((70, 20)),
+                           "units": "mm"}
+        try:
+            save_hdf5(save_dictionary, save_string, file_compression="lzf")
+            with h5py.File(save_string, "r") as h5file:
+                assert h5file["/volume"].chunks == (32, 20, 32)
+                assert h5file["/volume"].compression == "lzf"
+            read_dictionary = load_hdf5(save_string)
+        finally:
+            if os.path.exists(save_string):
+                os.remove(save_string)
+        assert_equals_recursive(save_dictionary, read_dictionary)
+
+    def test_read_from_open_file(self):
+        save_string = "test_open_file.hdf5"
+        save_dictionary = {"volume": np.random.random((10, 20, 30)),
+                           "units": "mm"}
+        try:
+            save_hdf5(save_dictionary, save_string)
+            with h5py.File(save_string, "r") as h5file:
+                read_dictionary = load_hdf5(h5file)
+                read_volume = load_hdf5(h5file, "/volume")
+        finally:
+            if os.path.exists(save_string):
+                os.remove(save_string)
+        assert_equals_recursive(save_dictionary, read_dictionary)
+        assert np.array_equal(save_dictionary["volume"], read_volume)
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2021 Division of Intelligent Medical Systems, DKFZ
+# SPDX-FileCopyrightText: 2021 Janek Groehl
+# SPDX-License-Identifier: MIT
+
+import unittest
+from unittest.mock import patch
+import os
+import tempfile
+import numpy as np
+
+from simpa import MCXAdapter, MCXAdapterReflectance
+from simpa.core.device_digital_twins import PencilBeamIlluminationGeometry
+from simpa.utils import Tags, Settings
+
+
+class TestMCXAdapter(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.settings = Settings({
+            Tags.SIMULATION_PATH: self.temporary_directory.name,
+            Tags.VOLUME_NAME: "TestMCXAdapter",
+            Tags.GPU: False
+        })
+        self.settings.set_optical_settings({
+            Tags.OPTICAL_MODEL_BINARY_PATH: "mcx"
+        })
+        self.bin_input_path = os.path.join(self.temporary_directory.name, "TestMCXAdapter.bin")
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    @staticmethod
+    def create_volumes(shape=(5, 4, 3)):
+        absorption_cm = np.random.random(shape)
+        scattering_cm = np.random.random(shape) * 100
+        anisotropy = np.random.random(shape)
+        return absorption_cm, scattering_cm, anisotropy
+
+    def assert_bin_input_written(self, adapter, absorption_cm, scattering_cm, anisotropy, assumed_anisotropy):
+        absorption_mm, scattering_mm = adapter.volumes_to_mm(absorption_cm=absorption_cm,
+                                                             scattering_cm=scattering_cm,
+                                                             anisotropy=anisotropy,
+                                                             assumed_anisotropy=assumed_anisotropy)
+        expected = np.stack([absorption_mm, scattering_mm], axis=-1).astype(np.float32)
+        written = np.fromfile(self.bin_input_path, dtype=np.float32).reshape(expected.shape)
+        assert np.array_equal(written, expected), "the MCX binary input did not match the given volumes"
+        assert (adapter.nx, adapter.ny, adapter.nz) == absorption_cm.shape
+
+    def test_generate_mcx_bin_input_recomputes_outside_of_run_forward_model(self):
+        adapter = MCXAdapter(self.settings)
+        absorption_cm, scattering_cm, anisotropy = self.create_volumes()
+
+        with patch.object(adapter, "pre_process_volumes", wraps=adapter.pre_process_volumes) as pre_process_volumes:
+            adapter.generate_mcx_bin_input(absorption_cm, scattering_cm, anisotropy, 0.9)
+            self.assert_bin_input_written(adapter, absorption_cm, scattering_cm, anisotropy, 0.9)
+
+            absorption_cm *= 5
+            adapter.generate_mcx_bin_input(absorption_cm, scattering_cm, anisotropy, 0.9)
+            self.assert_bin_input_written(adapter, absorption_cm, scattering_cm, anisotropy, 0.9)
+            assert pre_process_volumes.call_count == 2, "the volumes were not pre-processed again after a change"
+
+    def run_forward_model_with_bin_input(self, adapter, absorption_cm, scattering_cm, anisotropy):
+        def forward_model(absorption_cm, scattering_cm, anisotropy, illumination_geometry):
+            adapter.generate_mcx_bin_input(absorption_cm, scattering_cm, anisotropy, 0.9)
+            self.assert_bin_input_written(adapter, absorption_cm, scattering_cm, anisotropy, 0.9)
+            os.remove(self.bin_input_path)
+            return {Tags.DATA_FIELD_FLUENCE: np.ones_like(absorption_cm)}
+
+        with patch.object(adapter, "forward_model", side_effect=forward_model):
+            return adapter.run_forward_model(_device=[PencilBeamIlluminationGeometry(),
+                                                      PencilBeamIlluminationGeometry()],
+                                             device=None,
+                                             absorption=absorption_cm,
+                                             scattering=scattering_cm,
+                                             anisotropy=anisotropy)
+
+    def test_run_forward_model_reuses_and_releases_mcx_bin_input(self):
+        for adapter_class in [MCXAdapter, MCXAdapterReflectance]:
+            adapter = adapter_class(self.settings)
+            absorption_cm, scattering_cm, anisotropy = self.create_volumes()
+
+            with patch.object(adapter, "pre_process_volumes",
+                              wraps=adapter.pre_process_volumes) as pre_process_volumes:
+                results = self.run_forward_model_with_bin_input(adapter, absorption_cm, scattering_cm, anisotropy)
+                assert pre_process_volumes.call_count == 1, "the volumes were pre-processed for each illumination"
+
+            assert np.array_equal(results[Tags.DATA_FIELD_FLUENCE], np.ones_like(absorption_cm))
+            assert adapter.mcx_bin_input_buffer is None, "the MCX input buffer was kept after the simulation"
+            assert adapter.mcx_bin_input_references is None
+            assert not adapter.reuse_mcx_bin_input
+
+    def test_run_forward_model_releases_mcx_bin_input_on_error(self):
+        self.settings[Tags.SPACING_MM] = 1
+        self.settings.get_optical_settings()[Tags.OPTICAL_MODEL_NUMBER_PHOTONS] = 1e5
+        adapter = MCXAdapter(self.settings)
+        absorption_cm, scattering_cm, anisotropy = self.create_volumes()
+
+        with patch.object(adapter, "run_mcx", side_effect=RuntimeError("MCX failed")):
+            with self.assertRaises(RuntimeError):
+                adapter.run_forward_model(_device=PencilBeamIlluminationGeometry(),
+                                          device=None,
+                                          absorption=absorption_cm,
+                                          scattering=scattering_cm,
+                                          anisotropy=anisotropy)
+
+        assert adapter.mcx_bin_input_buffer is None, "the MCX input buffer was kept after a failed simulation"
+        assert not adapter.reuse_mcx_bin_input
+
+    def test_get_command_without_gpu_selection(self):
+        adapter = MCXAdapter(self.settings)
+        cmd = adapter.get_command()
+        assert cmd[0] == "mcx"
+        assert "-G" not in cmd and "-W" not in cmd
+        assert all(isinstance(argument, str) for argument in cmd[3:])
+
+    def test_get_command_with_gpu_selection(self):
+        self.settings.get_optical_settings()[Tags.MCX_WORKLOAD] = [20, 80]
+        for gpu_ids in ["11", 11]:
+            # values given with the plain key name, e.g. from a loaded settings file, bypass the type check of the tag
+            self.settings.get_optical_settings()[Tags.MCX_GPU_IDS[0]] = gpu_ids
+            cmd = MCXAdapter(self.settings).get_command()
+            assert cmd[cmd.index("-G") + 1] == "11", "the GPU ids were not passed as a string"
+            assert cmd[cmd.index("-W") + 1] == "20,80", "the GPU workload was not passed comma separated"
+
+    def test_reflectance_get_command_extends_mcx_command(self):
+        self.settings.get_optical_settings()[Tags.MCX_GPU_IDS] = "11"
+        self.settings.get_optical_settings()[Tags.OPTICAL_MODEL_NUMBER_PHOTONS] = 1e5
+        self.settings.get_optical_settings()[Tags.COMPUTE_DIFFUSE_REFLECTANCE] = True
+        self.settings.get_optical_settings()[Tags.COMPUTE_PHOTON_DIRECTION_AT_EXIT] = True
+        mcx_cmd = MCXAdapter(self.settings).get_command()
+        reflectance_cmd = MCXAdapterReflectance(self.settings).get_command()
+        assert reflectance_cmd[:len(mcx_cmd)] == mcx_cmd, "the reflectance command does not extend the mcx command"
+        reflectance_arguments = reflectance_cmd[len(mcx_cmd):]
+        assert reflectance_arguments[:2] == ["-H", "100000"]
+        assert "--saveref" in reflectance_arguments
+        assert "--savedetflag" in reflectance_arguments
@@ -167,6 +167,19 @@ class TestNoiseModels(unittest.TestCase):
                                           expected_mean=2.0,
                                           expected_std=0.1)
 
+        # Test constant noise without standard deviation
+        settings = {
+            Tags.DATA_FIELD: Tags.DATA_FIELD_ABSORPTION_PER_CM,
+            Tags.NOISE_MEAN: 1,
+            Tags.NOISE_STD: 0,
+            Tags.NOISE_MODE: Tags.NOISE_MODE_ADDITIVE
+        }
+        self.validate_noise_model_results(noise_model=noise_model,
+                                          noise_model_settings=settings,
+                                          background_value=1.0,
+                                          expected_mean=2.0,
+                                          expected_std=0.0)
+
     @unittest.expectedFailure
     def test_gamma_noise_no_data_field(self):
         noise_model = GammaNoise
@@ -3,9 +3,11 @@
 # SPDX-License-Identifier: MIT
 
 from simpa.core.simulation_modules.reconstruction_module.reconstruction_utils import apply_b_mode, get_apodization_factor, \
-    reconstruction_mode_transformation
+    reconstruction_mode_transformation, compute_delay_and_sum_values
 from simpa.utils.calculate import min_max_normalization
+from simpa.utils.settings import Settings
 from simpa.utils.tags import Tags
+from simpa.log import Logger
 import unittest
 import numpy as np
 import torch
@@ -87,3 +89,66 @@ class TestProcessing(unittest.TestCase):
         hilbert = apply_b_mode(self.test_image, method=Tags.RECONSTRUCTION_BMODE_METHOD_HILBERT_TRANSFORM)
         expected_hilbert = np.array([[1.2, 0.], [3., 255.]])
         assert np.equal(hilbert, expected_hilbert).all(), "computed hilbert transform array and expected don't match"
+
+    @staticmethod
+    def compute_reference_delay_and_sum_values(time_series_sensor_data, sensor_positions, xdim, ydim, zdim,
+                                               xdim_start, ydim_start, spacing_in_mm, speed_of_sound_in_m_per_s,
+                                               time_spacing_in_ms):
+        """
+        Straightforward delay and sum core computation with one gather per sensor coordinate and time sample.
+        """
+        x = xdim_start + torch.arange(xdim, dtype=torch.float32) + (0.5 if xdim % 2 == 0 else 0)
+        y = ydim_start + torch.arange(ydim, dtype=torch.float32)
+        z = torch.arange(zdim, dtype=torch.float32)
+        j = torch.arange(time_series_sensor_data.shape[0], dtype=torch.float32)
+        xx, yy, zz, jj = torch.meshgrid(x, y, z, j, indexing="ij")
+        jj = jj.long()
+        delays = torch.sqrt((yy * spacing_in_mm - sensor_positions[:, 2][jj]) ** 2 +
+                            (xx * spacing_in_mm - sensor_positions[:, 0][jj]) ** 2 +
+                            (zz * spacing_in_mm - sensor_positions[:, 1][jj]) ** 2) \
+            / (speed_of_sound_in_m_per_s * time_spacing_in_ms)
+        invalid_indices = torch.where(torch.logical_or(delays < 0,
+                                                       delays >= float(time_series_sensor_data.shape[1])))
+        torch.clip_(delays, min=0, max=time_series_sensor_data.shape[1] - 1)
+        lower_delays = (torch.floor(delays)).long()
+        upper_delays = lower_delays + 1
+        torch.clip_(upper_delays, min=0, max=time_series_sensor_data.shape[1] - 1)
+        lower_values = time_series_sensor_data[jj, lower_delays]
+        upper_values = time_series_sensor_data[jj, upper_delays]
+        values = lower_values * (upper_delays - delays) + upper_values * (delays - lower_delays)
+        values[invalid_indices] = 0
+        return values
+
+    def assert_delay_and_sum_values_match_reference(self, time_series_sensor_data, sensor_positions):
+        xdim, ydim, zdim = 6, 5, 4
+        values, n_sensor_elements = compute_delay_and_sum_values(
+            time_series_sensor_data, sensor_positions, xdim, ydim, zdim, -3, 3, 0, 5, 0, 4,
+            spacing_in_mm=0.5, speed_of_sound_in_m_per_s=1.5, time_spacing_in_ms=0.1, logger=Logger(),
+            torch_device=torch.device("cpu"), component_settings=Settings())
+        expected = self.compute_reference_delay_and_sum_values(time_series_sensor_data, sensor_positions, xdim, ydim,
+                                                               zdim, -3, 0, 0.5, 1.5, 0.1)
+        assert n_sensor_elements == time_series_sensor_data.shape[0]
+        assert values.dtype == expected.dtype, f"expected values of type {expected.dtype}, got {values.dtype}"
+        assert torch.allclose(values, expected, atol=1e-5), "delay and sum values don't match the reference"
+
+    def test_delay_and_sum_values_with_mixed_precision(self):
+        print("test delay and sum values with mixed precision")
+        torch.manual_seed(4711)
+        # long time series, so that no delay falls into the last sample interval
+        time_series_sensor_data = torch.randn(8, 1000, dtype=torch.float64)
+        sensor_positions = torch.rand(8, 3, dtype=torch.float64) * 10 - 5
+        for data_dtype in [torch.float32, torch.float64]:
+            for position_dtype in [torch.float32, torch.float64]:
+                self.assert_delay_and_sum_values_match_reference(time_series_sensor_data.to(data_dtype),
+                                                                 sensor_positions.to(position_dtype))
+
+    def test_delay_and_sum_values_with_non_contiguous_time_series(self):
+        print("test delay and sum values with non-contiguous time series")
+        torch.manual_seed(4711)
+        sensor_positions = torch.rand(8, 3, dtype=torch.float64) * 10 - 5
+        for data_dtype in [torch.float32, torch.float64]:
+            contiguous_time_series = torch.randn(8, 1000, dtype=data_dtype)
+            transposed_time_series = torch.randn(1000, 8, dtype=data_dtype).T
+            strided_time_series = torch.randn(8, 2000, dtype=data_dtype)[:, ::2]
+            for time_series_sensor_data in [contiguous_time_series, transposed_time_series, strided_time_series]:
+                self.assert_delay_and_sum_values_match_reference(time_series_sensor_data, sensor_positions)
@@ -38,6 +38,13 @@ class TestProcessing(unittest.TestCase):
 
         sp.assert_equal_shapes([array_1, array_2, array_3])
 
+    def test_numpy_arrays_not_same_dimensionality(self):
+        array_1 = np.random.random((5, 6, 7))
+        array_2 = np.random.random((5, 6, 7, 1))
+
+        with self.assertRaises(AssertionError):
+            sp.assert_equal_shapes([array_1, array_2])
+
     def test_numpy_2_arrays_same_size(self):
         array_1 = np.random.random((5, 6, 7))
         array_2 = np.random.random((5, 6, 7))